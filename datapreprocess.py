@@ -1,17 +1,74 @@
 import pandas as pd
 import numpy as np
+import ast
 import json
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+def _parse(obj):
+    """Parse a complex-column cell (historical_nav, top_holdings, etc.) into Python objects.
+
+    Cells are either already parsed (straight from the scraper) or stringified by the
+    Excel round-trip. True JSON goes through orjson when available; Python-repr strings
+    (single-quoted) go through ast.literal_eval, which, unlike the old
+    replace("'", '"') hack, survives apostrophes inside company/fund names.
+    """
+    if not isinstance(obj, str):
+        return obj
+    stripped = obj.lstrip()
+    if stripped.startswith(('[', '{')) and '"' in stripped:
+        return orjson.loads(obj) if orjson is not None else json.loads(obj)
+    return ast.literal_eval(obj)
+
+def parse_complex_columns(df):
+    """Decode every complex column once and return the parsed Series by column name.
+
+    The parsed objects are shared by the process_* functions and
+    simplify_complex_columns, so each cell's string is decoded a single time
+    instead of once per consumer.
+    """
+    def safe_parse(obj):
+        try:
+            return _parse(obj)
+        except (ValueError, SyntaxError):
+            return np.nan
+
+    complex_cols = ['historical_nav', 'top_holdings', 'asset_allocation', 'sector_allocation']
+    return {col: df[col].map(safe_parse) for col in complex_cols}
+
 def load_excel(file_path):
-    """Load the Excel file and return the DataFrame."""
+    """Load the Excel file and return the DataFrame.
+
+    Reads through a Parquet sidecar cache when one is up to date, since Parquet
+    loads an order of magnitude faster than xlsx. On a cache miss the Excel file
+    is read with the calamine engine when python-calamine is installed (openpyxl
+    otherwise) and the cache is refreshed for the next run.
+    """
+    parquet_cache = file_path + '.parquet'
     try:
-        df = pd.read_excel(file_path)
+        if os.path.exists(parquet_cache) and os.path.getmtime(parquet_cache) >= os.path.getmtime(file_path):
+            df = pd.read_parquet(parquet_cache)
+            logger.info(f"Loaded Parquet cache with {len(df)} rows and {len(df.columns)} columns.")
+            return df
+        try:
+            df = pd.read_excel(file_path, engine='calamine')
+        except ImportError:
+            df = pd.read_excel(file_path)
+        try:
+            df.to_parquet(parquet_cache, compression='zstd')
+        except (ImportError, ValueError) as e:
+            logger.warning(f"Could not write Parquet cache {parquet_cache}: {e}")
         logger.info(f"Loaded Excel file with {len(df)} rows and {len(df.columns)} columns.")
         return df
     except Exception as e:
@@ -26,8 +83,9 @@ def handle_missing_values(df):
     ]
     
     for col in columns_to_clean:
-        df[col] = df[col].replace([np.nan, '', None], 'N/A')
-        logger.info(f"Replaced missing values in {col} with 'N/A'.")
+        s = df[col]
+        df[col] = s.mask(s.isna() | s.astype(object).eq(''), 'N/A')
+    logger.info(f"Replaced missing values in {', '.join(columns_to_clean)} with 'N/A'.")
     
     # For equity funds, ensure average_maturity and yield_to_maturity are 'N/A'
     df.loc[df['type'] == 'Equity', ['average_maturity', 'yield_to_maturity']] = 'N/A'
@@ -42,44 +100,50 @@ def standardize_data_types(df):
         'one_year_return', 'three_year_return', 'five_year_return', 'equity_aum'
     ]
     for col in numeric_cols:
-        df[col] = pd.to_numeric(df[col], errors='coerce').fillna('N/A')
-        logger.info(f"Converted {col} to numeric (float).")
+        df[col] = pd.to_numeric(df[col], errors='coerce')
     
-    # String columns
+    # String columns (skip the rebuild when the column is already string dtype)
     string_cols = ['name', 'risk', 'type', 'link']
     for col in string_cols:
-        df[col] = df[col].astype(str)
+        if not pd.api.types.is_string_dtype(df[col]):
+            df[col] = df[col].astype(str)
+
+    # risk and type draw from a handful of labels; as categoricals their
+    # comparisons and groupbys work on integer codes instead of strings.
+    df['risk'] = df['risk'].astype('category')
+    df['type'] = df['type'].astype('category')
     
     # Exit load and rating (special handling)
-    df['exit_load'] = pd.to_numeric(df['exit_load'], errors='coerce').fillna('N/A')
-    df['rating'] = pd.to_numeric(df['rating'], errors='coerce', downcast='integer').fillna('N/A')
-    
+    # Missing values stay NaN so the columns keep a float dtype; they are
+    # rendered as 'N/A' only when the cleaned data is written out.
+    df['exit_load'] = pd.to_numeric(df['exit_load'], errors='coerce')
+    # Nullable Int8 keeps ratings integral (1-5) at one byte per cell while
+    # still representing missing values.
+    df['rating'] = pd.to_numeric(df['rating'], errors='coerce').astype('Int8')
+
+    logger.info("Standardized %d numeric and %d string columns.", len(numeric_cols) + 2, len(string_cols))
     return df
 
 def validate_data(df):
     """Validate data for outliers and consistency."""
     # Check for negative AUM, NAV, minimum_investment, minimum_sip_investment, or equity_aum
     for col in ['aum', 'nav', 'minimum_investment', 'minimum_sip_investment', 'equity_aum']:
-        if col in df and (df[col].apply(lambda x: isinstance(x, (int, float)) and x < 0)).any():
+        if col in df and (df[col] < 0).any():
             logger.warning(f"Negative values found in {col}.")
     
-    # Check equity_aum <= aum
-    valid_rows = df[df['equity_aum'].apply(lambda x: isinstance(x, (int, float))) & 
-                   df['aum'].apply(lambda x: isinstance(x, (int, float)))]
-    if (valid_rows['equity_aum'] > valid_rows['aum']).any():
+    # Check equity_aum <= aum (NaN comparisons are False, so missing values pass)
+    if (df['equity_aum'] > df['aum']).any():
         logger.warning(f"Equity AUM exceeds total AUM for some funds.")
-    
+
     # Check for unrealistic returns (>100% or <-100%)
     for col in ['one_year_return', 'three_year_return', 'five_year_return']:
         if col in df:
-            invalid = df[col].apply(lambda x: isinstance(x, (int, float)) and (x > 100 or x < -100))
+            invalid = ~df[col].between(-100, 100) & df[col].notna()
             if invalid.any():
                 logger.warning(f"Unrealistic returns found in {col}: {df[invalid][['name', col]]}")
-    
+
     # Check debt_per + equity_per ≈ 100%
-    valid_rows = df[df['debt_per'].apply(lambda x: isinstance(x, (int, float))) & 
-                   df['equity_per'].apply(lambda x: isinstance(x, (int, float)))]
-    total_allocation = valid_rows['debt_per'] + valid_rows['equity_per']
+    total_allocation = df['debt_per'] + df['equity_per']
     if (total_allocation < 95).any() or (total_allocation > 105).any():
         logger.warning(f"Inconsistent debt_per + equity_per found in some funds.")
     
@@ -89,57 +153,99 @@ def validate_data(df):
     
     return df
 
-def process_historical_nav(df):
-    """Convert historical_nav into a separate DataFrame for time-series analysis."""
-    nav_records = []
-    for _, row in df.iterrows():
-        fund_name = row['name']
+def process_historical_nav(df, parsed_nav):
+    """Convert pre-parsed historical_nav into a time-series DataFrame plus per-fund summaries.
+
+    Returns (nav_df, summaries) where summaries is a list aligned with df's
+    rows holding the 'Latest NAV: ... on ...' string for each fund.
+    """
+    names = df['name'].to_numpy()
+    entries = parsed_nav.to_numpy()
+    summaries = []
+    # The parsed lists already know their lengths, so the output columns can
+    # be preallocated once and filled by slice instead of growing Python
+    # lists through append/extend.
+    lengths = np.fromiter((len(e) if isinstance(e, list) else 0 for e in entries),
+                          dtype=np.intp, count=len(entries))
+    total = int(lengths.sum())
+    fund_col = np.empty(total, dtype=object)
+    date_col = np.empty(total, dtype=object)
+    nav_col = np.empty(total, dtype=np.float64)
+    pos = 0
+    for fund_name, nav_data, n in zip(names, entries, lengths):
+        if n == 0:
+            summaries.append('N/A')
+            continue
         try:
-            # Parse historical_nav (list of dictionaries)
-            nav_data = row['historical_nav']
-            if isinstance(nav_data, str):
-                nav_data = json.loads(nav_data.replace("'", "\""))
-            for entry in nav_data:
-                nav_records.append({
-                    'fund_name': fund_name,
-                    'date': pd.to_datetime(entry['date']),
-                    'nav': float(entry['nav'])
-                })
+            entry_dates = [entry['date'] for entry in nav_data]
+            entry_navs = [float(entry['nav']) for entry in nav_data]
         except Exception as e:
             logger.warning(f"Error processing historical_nav for {fund_name}: {e}")
-    
-    nav_df = pd.DataFrame(nav_records)
+            summaries.append('N/A')
+            continue
+        date_col[pos:pos + n] = entry_dates
+        nav_col[pos:pos + n] = entry_navs
+        fund_col[pos:pos + n] = fund_name
+        pos += n
+        # ISO date strings compare chronologically, so max() finds the latest
+        latest = max(range(n), key=entry_dates.__getitem__)
+        summaries.append(f"Latest NAV: {nav_data[latest]['nav']} on {entry_dates[latest]}")
+
+    nav_df = pd.DataFrame({
+        'fund_name': fund_col[:pos],
+        'date': date_col[:pos],
+        'nav': nav_col[:pos],
+    })
+    # Parse all dates in one vectorized call instead of once per entry. The
+    # scraper emits '%Y-%m-%d', so passing the format takes pandas' C fast
+    # path, and cache=True dedupes the small set of unique trading dates.
+    try:
+        nav_df['date'] = pd.to_datetime(nav_df['date'], format='%Y-%m-%d', cache=True)
+    except ValueError:
+        nav_df['date'] = pd.to_datetime(nav_df['date'], cache=True)
     
     # Validate NAVs
     if (nav_df['nav'] <= 0).any():
         logger.warning(f"Invalid NAV values (non-positive) found in historical_nav.")
     
-    # Sort by fund and date
-    nav_df = nav_df.sort_values(['fund_name', 'date']).reset_index(drop=True)
+    # Sort by fund and date. With fund_name dictionary-encoded as a
+    # categorical, the sort compares integer codes instead of repeating
+    # string comparisons per NAV row; ignore_index skips the extra
+    # reset_index copy.
+    nav_df['fund_name'] = nav_df['fund_name'].astype('category')
+    nav_df = nav_df.sort_values(['fund_name', 'date'], ignore_index=True)
     logger.info(f"Created historical_nav DataFrame with {len(nav_df)} rows.")
     
-    return nav_df
+    return nav_df, summaries
 
-def process_top_holdings(df):
-    """Convert top_holdings into a separate DataFrame for portfolio analysis."""
-    holdings_records = []
-    for _, row in df.iterrows():
-        fund_name = row['name']
+def process_top_holdings(df, parsed_holdings):
+    """Convert pre-parsed top_holdings into a tidy DataFrame plus a per-fund summary Series."""
+    names = df['name'].to_numpy()
+    entries = parsed_holdings.to_numpy()
+    lengths = np.fromiter((len(e) if isinstance(e, list) else 0 for e in entries),
+                          dtype=np.intp, count=len(entries))
+    total = int(lengths.sum())
+    fund_col = np.empty(total, dtype=object)
+    company_col = np.empty(total, dtype=object)
+    pct_col = np.empty(total, dtype=np.float64)
+    pos = 0
+    for fund_name, holdings_data, n in zip(names, entries, lengths):
+        if n == 0:
+            continue
         try:
-            # Parse top_holdings (list of dictionaries)
-            holdings_data = row['top_holdings']
-            if isinstance(holdings_data, str):
-                holdings_data = json.loads(holdings_data.replace("'", "\""))
-            for entry in holdings_data:
-                holdings_records.append({
-                    'fund_name': fund_name,
-                    'company': entry['company'],
-                    'percentage': float(entry['percentage'])
-                })
+            company_col[pos:pos + n] = [entry['company'] for entry in holdings_data]
+            pct_col[pos:pos + n] = [float(entry['percentage']) for entry in holdings_data]
         except Exception as e:
             logger.warning(f"Error processing top_holdings for {fund_name}: {e}")
-    
-    holdings_df = pd.DataFrame(holdings_records)
+            continue
+        fund_col[pos:pos + n] = fund_name
+        pos += n
+
+    holdings_df = pd.DataFrame({
+        'fund_name': fund_col[:pos],
+        'company': company_col[:pos],
+        'percentage': pct_col[:pos],
+    })
     
     # Validate percentages
     if (holdings_df['percentage'] <= 0).any():
@@ -147,67 +253,78 @@ def process_top_holdings(df):
     
     # Check total percentage per fund
     total_per_fund = holdings_df.groupby('fund_name')['percentage'].sum()
-    for fund, total in total_per_fund.items():
-        if total < 20:
-            logger.warning(f"Low total holdings percentage for {fund}: {total}%")
+    low_totals = total_per_fund[total_per_fund < 20]
+    if not low_totals.empty:
+        logger.warning(f"Low total holdings percentage for: {low_totals.to_dict()}")
     
+    # Per-fund summary built from the already-typed tidy columns
+    fragments = holdings_df['company'] + ' (' + holdings_df['percentage'].astype(str) + '%)'
+    summary = fragments.groupby(holdings_df['fund_name']).agg('; '.join)
+
     logger.info(f"Created top_holdings DataFrame with {len(holdings_df)} rows.")
     
-    return holdings_df
-
-def process_asset_allocation(df):
-    """Extract asset_allocation into separate columns and validate."""
-    # Initialize new columns
-    df['asset_equity'] = np.nan
-    df['asset_debt'] = np.nan
-    df['asset_cash'] = np.nan
-    
-    for idx, row in df.iterrows():
-        fund_name = row['name']
-        try:
-            # Parse asset_allocation (dictionary)
-            alloc_data = row['asset_allocation']
-            if isinstance(alloc_data, str):
-                alloc_data = json.loads(alloc_data.replace("'", "\""))
-            
-            df.at[idx, 'asset_equity'] = float(alloc_data.get('equity', np.nan))
-            df.at[idx, 'asset_debt'] = float(alloc_data.get('debt', np.nan))
-            df.at[idx, 'asset_cash'] = float(alloc_data.get('cash', np.nan))
-            
-            # Validate sum of allocations
-            total = sum([alloc_data.get(key, 0) for key in ['equity', 'debt', 'cash'] if isinstance(alloc_data.get(key), (int, float))])
-            if total < 95 or total > 105:
-                logger.warning(f"Inconsistent asset allocation for {fund_name}: Total = {total}%")
-        except Exception as e:
-            logger.warning(f"Error processing asset_allocation for {fund_name}: {e}")
-    
-    # Convert to numeric and handle missing values
-    for col in ['asset_equity', 'asset_debt', 'asset_cash']:
-        df[col] = pd.to_numeric(df[col], errors='coerce').fillna('N/A')
-    
+    return holdings_df, summary
+
+def process_asset_allocation(df, parsed_alloc):
+    """Extract pre-parsed asset_allocation into separate columns; also build summaries.
+
+    Returns (df, summaries) where summaries is a list aligned with df's rows.
+    """
+    def component(key):
+        return [alloc.get(key, np.nan) if isinstance(alloc, dict) else np.nan
+                for alloc in parsed_alloc]
+
+    alloc_df = pd.DataFrame({
+        'asset_equity': pd.to_numeric(component('equity'), errors='coerce'),
+        'asset_debt': pd.to_numeric(component('debt'), errors='coerce'),
+        'asset_cash': pd.to_numeric(component('cash'), errors='coerce'),
+    }, index=df.index)
+
+    # Validate sum of allocations in one vectorized pass (missing components count as 0)
+    total = alloc_df.sum(axis=1)
+    bad = ~total.between(95, 105) & alloc_df.notna().any(axis=1)
+    for fund_name, fund_total in zip(df.loc[bad, 'name'], total[bad]):
+        logger.warning(f"Inconsistent asset allocation for {fund_name}: Total = {fund_total}%")
+
+    df[['asset_equity', 'asset_debt', 'asset_cash']] = alloc_df
+
+    summaries = [
+        f"Equity: {alloc.get('equity', 'N/A')}%, Debt: {alloc.get('debt', 'N/A')}%, Cash: {alloc.get('cash', 'N/A')}%"
+        if isinstance(alloc, dict) else 'N/A'
+        for alloc in parsed_alloc
+    ]
+
     logger.info("Processed asset_allocation into separate columns.")
-    return df
+    return df, summaries
 
-def process_sector_allocation(df):
-    """Convert sector_allocation into a separate DataFrame for analysis."""
-    sector_records = []
-    for _, row in df.iterrows():
-        fund_name = row['name']
+def process_sector_allocation(df, parsed_sectors):
+    """Convert pre-parsed sector_allocation into a tidy DataFrame plus a per-fund summary Series."""
+    names = df['name'].to_numpy()
+    entries = parsed_sectors.to_numpy()
+    lengths = np.fromiter((len(e) if isinstance(e, list) else 0 for e in entries),
+                          dtype=np.intp, count=len(entries))
+    total = int(lengths.sum())
+    fund_col = np.empty(total, dtype=object)
+    sector_col = np.empty(total, dtype=object)
+    pct_col = np.empty(total, dtype=np.float64)
+    pos = 0
+    for fund_name, sector_data, n in zip(names, entries, lengths):
+        if n == 0:
+            continue
         try:
-            # Parse sector_allocation (list of dictionaries)
-            sector_data = row['sector_allocation']
-            if isinstance(sector_data, str):
-                sector_data = json.loads(sector_data.replace("'", "\""))
-            for entry in sector_data:
-                sector_records.append({
-                    'fund_name': fund_name,
-                    'sector': entry['sector'],
-                    'percentage': float(entry['percentage'])
-                })
+            sector_col[pos:pos + n] = [entry['sector'] for entry in sector_data]
+            pct_col[pos:pos + n] = [float(entry['percentage']) for entry in sector_data]
         except Exception as e:
             logger.warning(f"Error processing sector_allocation for {fund_name}: {e}")
-    
-    sector_df = pd.DataFrame(sector_records)
+            continue
+        fund_col[pos:pos + n] = fund_name
+        pos += n
+
+    sector_df = pd.DataFrame({
+        'fund_name': fund_col[:pos],
+        'sector': sector_col[:pos],
+        'percentage': pct_col[:pos],
+    })
     
     # Validate percentages
     if (sector_df['percentage'] <= 0).any():
@@ -215,71 +332,47 @@ def process_sector_allocation(df):
     
     # Check total percentage per fund
     total_per_fund = sector_df.groupby('fund_name')['percentage'].sum()
-    for fund, total in total_per_fund.items():
-        if total < 90 or total > 110:
-            logger.warning(f"Inconsistent sector allocation total for {fund}: {total}%")
+    bad_totals = total_per_fund[(total_per_fund < 90) | (total_per_fund > 110)]
+    if not bad_totals.empty:
+        logger.warning(f"Inconsistent sector allocation totals for: {bad_totals.to_dict()}")
     
+    fragments = sector_df['sector'] + ' (' + sector_df['percentage'].astype(str) + '%)'
+    summary = fragments.groupby(sector_df['fund_name']).agg('; '.join)
+
     logger.info(f"Created sector_allocation DataFrame with {len(sector_df)} rows.")
     
-    return sector_df
+    return sector_df, summary
+
+def simplify_complex_columns(df, nav_summary, holdings_summary, alloc_summary, sector_summary):
+    """Attach the summary columns built by the processors and drop the complex columns."""
+    df = df.assign(
+        historical_nav_summary=nav_summary,
+        top_holdings_summary=df['name'].map(holdings_summary).fillna('N/A'),
+        asset_allocation_summary=alloc_summary,
+        sector_allocation_summary=df['name'].map(sector_summary).fillna('N/A'),
+    )
 
-def simplify_complex_columns(df):
-    """Simplify historical_nav, top_holdings, asset_allocation, and sector_allocation in the main DataFrame."""
-    # Convert historical_nav to a string summary (e.g., latest NAV and date)
-    def summarize_nav(nav_data):
-        try:
-            if isinstance(nav_data, str):
-                nav_data = json.loads(nav_data.replace("'", "\""))
-            latest = max(nav_data, key=lambda x: x['date'])
-            return f"Latest NAV: {latest['nav']} on {latest['date']}"
-        except:
-            return "N/A"
-    
-    # Convert top_holdings to a string summary
-    def summarize_holdings(holdings_data):
-        try:
-            if isinstance(holdings_data, str):
-                holdings_data = json.loads(holdings_data.replace("'", "\""))
-            return "; ".join([f"{h['company']} ({h['percentage']}%)" for h in holdings_data])
-        except:
-            return "N/A"
-    
-    # Convert asset_allocation to a string summary
-    def summarize_asset_allocation(alloc_data):
-        try:
-            if isinstance(alloc_data, str):
-                alloc_data = json.loads(alloc_data.replace("'", "\""))
-            return f"Equity: {alloc_data.get('equity', 'N/A')}%, Debt: {alloc_data.get('debt', 'N/A')}%, Cash: {alloc_data.get('cash', 'N/A')}%"
-        except:
-            return "N/A"
-    
-    # Convert sector_allocation to a string summary
-    def summarize_sector_allocation(sector_data):
-        try:
-            if isinstance(sector_data, str):
-                sector_data = json.loads(sector_data.replace("'", "\""))
-            return "; ".join([f"{s['sector']} ({s['percentage']}%)" for s in sector_data])
-        except:
-            return "N/A"
-    
-    df['historical_nav_summary'] = df['historical_nav'].apply(summarize_nav)
-    df['top_holdings_summary'] = df['top_holdings'].apply(summarize_holdings)
-    df['asset_allocation_summary'] = df['asset_allocation'].apply(summarize_asset_allocation)
-    df['sector_allocation_summary'] = df['sector_allocation'].apply(summarize_sector_allocation)
-    
     # Drop original complex columns
     df = df.drop(['historical_nav', 'top_holdings', 'asset_allocation', 'sector_allocation'], axis=1)
-    
+
     return df
 
 def save_cleaned_data(fund_df, nav_df, holdings_df, sector_df, output_file):
     """Save the cleaned data to an Excel file with multiple sheets."""
     try:
-        with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
-            fund_df.to_excel(writer, sheet_name='Fund_Data', index=False)
-            nav_df.to_excel(writer, sheet_name='Historical_NAV', index=False)
-            holdings_df.to_excel(writer, sheet_name='Top_Holdings', index=False)
-            sector_df.to_excel(writer, sheet_name='Sector_Allocation', index=False)
+        # xlsxwriter serializes much faster and leaner than openpyxl, which
+        # builds the whole workbook as an in-memory XML tree. (Its
+        # constant_memory mode would stream rows to disk too, but it requires
+        # strict row-order writes, which DataFrame.to_excel does not do.)
+        try:
+            writer_ctx = pd.ExcelWriter(output_file, engine='xlsxwriter')
+        except ImportError:
+            writer_ctx = pd.ExcelWriter(output_file, engine='openpyxl')
+        with writer_ctx as writer:
+            fund_df.to_excel(writer, sheet_name='Fund_Data', index=False, na_rep='N/A')
+            nav_df.to_excel(writer, sheet_name='Historical_NAV', index=False, na_rep='N/A')
+            holdings_df.to_excel(writer, sheet_name='Top_Holdings', index=False, na_rep='N/A')
+            sector_df.to_excel(writer, sheet_name='Sector_Allocation', index=False, na_rep='N/A')
         logger.info(f"Saved cleaned data to {output_file}.")
     except Exception as e:
         logger.error(f"Error saving Excel file: {e}")
@@ -299,20 +392,24 @@ def preprocess_data(input_file, output_file):
     # Validate data
     df = validate_data(df)
     
-    # Process historical_nav
-    nav_df = process_historical_nav(df)
-    
-    # Process top_holdings
-    holdings_df = process_top_holdings(df)
-    
-    # Process asset_allocation
-    df = process_asset_allocation(df)
-    
-    # Process sector_allocation
-    sector_df = process_sector_allocation(df)
+    # Parse the complex columns once, shared by every pass below
+    parsed = parse_complex_columns(df)
+    
+    # The four processors consume independent parsed columns, so run them
+    # concurrently; process_asset_allocation gets its own copy of df since it
+    # is the only one that writes columns back.
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        nav_future = executor.submit(process_historical_nav, df, parsed['historical_nav'])
+        holdings_future = executor.submit(process_top_holdings, df, parsed['top_holdings'])
+        sector_future = executor.submit(process_sector_allocation, df, parsed['sector_allocation'])
+        alloc_future = executor.submit(process_asset_allocation, df.copy(), parsed['asset_allocation'])
+        nav_df, nav_summary = nav_future.result()
+        holdings_df, holdings_summary = holdings_future.result()
+        sector_df, sector_summary = sector_future.result()
+        df, alloc_summary = alloc_future.result()
     
     # Simplify complex columns in main DataFrame
-    df = simplify_complex_columns(df)
+    df = simplify_complex_columns(df, nav_summary, holdings_summary, alloc_summary, sector_summary)
     
     # Save cleaned data
     save_cleaned_data(df, nav_df, holdings_df, sector_df, output_file)
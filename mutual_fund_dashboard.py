@@ -1,3 +1,6 @@
+import os
+import re
+
 import streamlit as st
 import pandas as pd
 import plotly.express as px
@@ -5,17 +8,198 @@ import plotly.graph_objects as go
 import numpy as np
 from datetime import datetime
 
+try:
+    import polars as pl
+except ImportError:  # optional fast path; pandas cleaning still works without it
+    pl = None
+
+# Sheet1 columns coerced to numeric during cleaning.
+SHEET1_NUMERIC_COLS = [
+    "aum", "nav", "rating", "minimum_investment", "minimum_sip_investment",
+    "debt_per", "equity_per", "equity_aum", "asset_equity", "asset_debt",
+    "asset_cash", "one_year_return", "three_year_return", "five_year_return",
+    "exit_load", "pe", "pb", "average_maturity", "yield_to_maturity",
+]
+
+# "Energy (39.18%); Capital Goods (28.41%); ..." -> (name, pct) pairs.
+SECTOR_PAT = re.compile(r"([^;()]+)\(\s*([\d.]+)\s*%\)")
+
+# Content-based DataFrame hashing for st.cache_data: the cached figure
+# builders below take small aggregated frames, so hashing is cheap and the
+# figure is rebuilt only when the aggregate actually changes.
+DF_HASH = {pd.DataFrame: lambda d: pd.util.hash_pandas_object(d, index=True).values.tobytes()}
+
 # Set page configuration
 st.set_page_config(page_title="Mutual Fund Analysis Dashboard", layout="wide")
 
 # Title
 st.title("Mutual Fund Analysis Dashboard")
 
-# Load data from Excel with the correct sheet names
+# Parquet sidecars for each sheet: columnar reads skip the xlsx XML parsing
+# entirely on warm starts.
+PARQUET_SHEETS = {
+    "Fund_Data": "fund_data.parquet",
+    "Historical_NAV": "historical_nav.parquet",
+    "Top_Holdings": "top_holdings.parquet",
+}
+
+
+def read_sheet(path, sheet_name):
+    """Read one sheet, preferring its Parquet sidecar over the xlsx workbook."""
+    parquet_path = PARQUET_SHEETS[sheet_name]
+    if os.path.exists(parquet_path) and (
+        not os.path.exists(path)
+        or os.path.getmtime(parquet_path) >= os.path.getmtime(path)
+    ):
+        return pd.read_parquet(parquet_path)
+    df = pd.read_excel(path, sheet_name=sheet_name)
+    try:
+        df.to_parquet(parquet_path, engine="pyarrow", compression="zstd")
+    except (ImportError, OSError):
+        pass  # no pyarrow or read-only directory; keep serving from xlsx
+    return df
+
+
+def lttb_downsample(df, x_col, y_col, n_out=2000):
+    """Largest-Triangle-Three-Buckets downsampling for line charts.
+
+    Caps the points shipped to Plotly.js at n_out while keeping the trace
+    visually identical; frames at or under the budget pass through as-is.
+    """
+    n = len(df)
+    if n <= n_out:
+        return df
+    x = df[x_col].astype("int64").to_numpy(dtype=np.float64)
+    y = df[y_col].to_numpy(dtype=np.float64)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    keep = np.empty(n_out, dtype=np.int64)
+    keep[0] = 0
+    keep[-1] = n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo = edges[i]
+        hi = max(edges[i + 1], lo + 1)
+        if i < n_out - 3:
+            nx = x[edges[i + 1]:edges[i + 2]].mean()
+            ny = y[edges[i + 1]:edges[i + 2]].mean()
+        else:
+            nx, ny = x[-1], y[-1]
+        # area of the triangle (previous kept point, candidate, next-bucket mean)
+        area = np.abs((x[a] - nx) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (ny - y[a]))
+        a = lo + int(area.argmax())
+        keep[i + 1] = a
+    return df.iloc[keep]
+
+
+# Load and clean the three sheets once per session; st.cache_data makes every
+# widget-triggered rerun skip the Excel parsing and cleaning entirely.
+@st.cache_data(show_spinner=False)
+def load_data(path):
+    sheet1 = read_sheet(path, "Fund_Data")
+    sheet2 = read_sheet(path, "Historical_NAV")
+    sheet3 = read_sheet(path, "Top_Holdings")
+
+    # Clean and process Sheet1 (Fund_Data). Polars runs the 20-odd numeric
+    # coercions as one parallel columnar pass; the pandas path below is the
+    # fallback when polars is not installed.
+    if pl is not None:
+        sheet1 = (
+            pl.from_pandas(sheet1)
+            .lazy()
+            .drop_nulls(subset=["name", "aum", "nav"])
+            .with_columns(
+                [pl.col(c).cast(pl.Float64, strict=False).fill_null(0.0)
+                 for c in SHEET1_NUMERIC_COLS]
+                + [pl.col("risk").fill_null("Unknown"),
+                   pl.col("type").fill_null("Unknown")]
+            )
+            .collect()
+            .to_pandas()
+        )
+    else:
+        sheet1 = sheet1.dropna(subset=["name", "aum", "nav"])
+        sheet1[SHEET1_NUMERIC_COLS] = (
+            sheet1[SHEET1_NUMERIC_COLS]
+            .apply(pd.to_numeric, errors="coerce")
+            .fillna(0)
+        )
+        sheet1["risk"] = sheet1["risk"].fillna("Unknown")
+        sheet1["type"] = sheet1["type"].fillna("Unknown")
+
+    # Category dtype shrinks the two label columns and speeds up the
+    # .isin() filtering the sidebar does on every rerun.
+    sheet1["risk"] = sheet1["risk"].astype("category")
+    sheet1["type"] = sheet1["type"].astype("category")
+
+    # float32 is plenty for display/aggregation and halves the copy cost of
+    # every downstream filter, groupby and melt.
+    sheet1[SHEET1_NUMERIC_COLS] = sheet1[SHEET1_NUMERIC_COLS].astype("float32")
+
+    # Rename columns for consistency
+    sheet1 = sheet1.rename(columns={
+        "name": "fund_name",
+        "aum": "aum_funds_individual_lst",
+        "nav": "nav_funds_individual_lst",
+        "rating": "rating_of_funds_individual_lst",
+        "minimum_investment": "minimum_funds_individual_lst",
+        "minimum_sip_investment": "minimum_sip_funds_individual_lst",
+        "debt_per": "debt_per",
+        "equity_per": "equity_per",
+        "equity_aum": "equity_aum",
+        "asset_equity": "asset_equity",
+        "asset_debt": "asset_debt",
+        "asset_cash": "asset_cash",
+        "risk": "risk_of_the_fund",
+        "type": "type_of_fund",
+        "one_year_return": "one_year_returns",
+        "three_year_return": "three_year_returns",
+        "five_year_return": "five_year_returns",
+        "historical_nav_summary": "historical_nav_summary",
+        "top_holdings_summary": "top_holdings_summary",
+        "asset_allocation_summary": "asset_allocation_summary",
+        "sector_allocation_summary": "sector_allocation_summary"
+    })
+
+    # Clean and process Sheet2 (Historical_NAV)
+    sheet2 = sheet2.dropna(subset=["fund_name", "date", "nav"])
+    # cache=True memoizes parsing of repeated date strings (funds share
+    # trading dates); it is a no-op when the Parquet sidecar already holds
+    # parsed datetimes.
+    sheet2["date"] = pd.to_datetime(sheet2["date"], format="%d-%m-%Y %H:%M:%S", errors="coerce", cache=True)
+    sheet2 = sheet2.dropna(subset=["date"])
+    sheet2["nav"] = pd.to_numeric(sheet2["nav"], errors="coerce").fillna(0)
+    # Sort once here so per-fund slices come out date-ordered already, then
+    # index by fund so the per-fund lookups below are hash/binary-search
+    # instead of a full boolean scan per rerun.
+    sheet2 = sheet2.sort_values(["fund_name", "date"], ignore_index=True).set_index("fund_name")
+
+    # Precompute every fund's CAGR in one vectorized pass; the prediction
+    # calculator then just looks up a scalar.
+    cagr_table = sheet2.groupby(level=0, observed=True).agg(
+        start_nav=("nav", "first"),
+        end_nav=("nav", "last"),
+        start_date=("date", "first"),
+        end_date=("date", "last"),
+        count=("nav", "size"),
+    )
+    years = (cagr_table["end_date"] - cagr_table["start_date"]).dt.days / 365.25
+    with np.errstate(divide="ignore", invalid="ignore"):
+        growth = (cagr_table["end_nav"] / cagr_table["start_nav"]) ** (1 / years) - 1
+    valid = (years > 0) & (cagr_table["start_nav"] > 0) & (cagr_table["end_nav"] > 0)
+    cagr_table["cagr"] = np.where(valid, growth, 0.0)
+
+    # Downcast after the CAGR math so the exponentiation ran in float64.
+    sheet2["nav"] = sheet2["nav"].astype("float32")
+
+    # Clean and process Sheet3 (Top_Holdings)
+    sheet3 = sheet3.dropna(subset=["fund_name", "company", "percentage"])
+    sheet3["percentage"] = pd.to_numeric(sheet3["percentage"], errors="coerce").fillna(0).astype("float32")
+    sheet3 = sheet3.set_index("fund_name").sort_index()
+
+    return sheet1, sheet2, sheet3, cagr_table
+
 try:
-    sheet1 = pd.read_excel("cleaned_data.xlsx", sheet_name="Fund_Data")
-    sheet2 = pd.read_excel("cleaned_data.xlsx", sheet_name="Historical_NAV")
-    sheet3 = pd.read_excel("cleaned_data.xlsx", sheet_name="Top_Holdings")
+    sheet1, sheet2, sheet3, cagr_table = load_data("cleaned_data.xlsx")
 except FileNotFoundError:
     st.error("Error: 'cleaned_data.xlsx' not found. Please ensure the file is in the same directory as this script.")
     st.stop()
@@ -24,78 +208,13 @@ except ValueError as ve:
     excel_file = pd.ExcelFile("cleaned_data.xlsx")
     st.write("Available sheet names in the Excel file:", excel_file.sheet_names)
     st.stop()
+except KeyError as ke:
+    st.error(f"Error: {str(ke)}. Please check the column names in 'cleaned_data.xlsx' and update the script.")
+    st.stop()
 except Exception as e:
     st.error(f"Error loading data: {str(e)}")
     st.stop()
 
-# Clean and process Sheet1 (Fund_Data)
-sheet1 = sheet1.dropna(subset=["name", "aum", "nav"])
-sheet1["aum"] = pd.to_numeric(sheet1["aum"], errors="coerce").fillna(0)
-sheet1["nav"] = pd.to_numeric(sheet1["nav"], errors="coerce").fillna(0)
-sheet1["rating"] = pd.to_numeric(sheet1["rating"], errors="coerce").fillna(0)
-sheet1["minimum_investment"] = pd.to_numeric(sheet1["minimum_investment"], errors="coerce").fillna(0)
-sheet1["minimum_sip_investment"] = pd.to_numeric(sheet1["minimum_sip_investment"], errors="coerce").fillna(0)
-sheet1["debt_per"] = pd.to_numeric(sheet1["debt_per"], errors="coerce").fillna(0)
-sheet1["equity_per"] = pd.to_numeric(sheet1["equity_per"], errors="coerce").fillna(0)
-sheet1["equity_aum"] = pd.to_numeric(sheet1["equity_aum"], errors="coerce").fillna(0)
-sheet1["asset_equity"] = pd.to_numeric(sheet1["asset_equity"], errors="coerce").fillna(0)
-sheet1["asset_debt"] = pd.to_numeric(sheet1["asset_debt"], errors="coerce").fillna(0)
-sheet1["asset_cash"] = pd.to_numeric(sheet1["asset_cash"], errors="coerce").fillna(0)
-sheet1["risk"] = sheet1["risk"].fillna("Unknown")
-sheet1["type"] = sheet1["type"].fillna("Unknown")
-sheet1["one_year_return"] = pd.to_numeric(sheet1["one_year_return"], errors="coerce").fillna(0)
-sheet1["three_year_return"] = pd.to_numeric(sheet1["three_year_return"], errors="coerce").fillna(0)
-sheet1["five_year_return"] = pd.to_numeric(sheet1["five_year_return"], errors="coerce").fillna(0)
-sheet1["exit_load"] = pd.to_numeric(sheet1["exit_load"], errors="coerce").fillna(0)
-sheet1["pe"] = pd.to_numeric(sheet1["pe"], errors="coerce").fillna(0)
-sheet1["pb"] = pd.to_numeric(sheet1["pb"], errors="coerce").fillna(0)
-sheet1["average_maturity"] = pd.to_numeric(sheet1["average_maturity"], errors="coerce").fillna(0)
-sheet1["yield_to_maturity"] = pd.to_numeric(sheet1["yield_to_maturity"], errors="coerce").fillna(0)
-
-# Rename columns for consistency
-sheet1 = sheet1.rename(columns={
-    "name": "fund_name",
-    "aum": "aum_funds_individual_lst",
-    "nav": "nav_funds_individual_lst",
-    "rating": "rating_of_funds_individual_lst",
-    "minimum_investment": "minimum_funds_individual_lst",
-    "minimum_sip_investment": "minimum_sip_funds_individual_lst",
-    "debt_per": "debt_per",
-    "equity_per": "equity_per",
-    "equity_aum": "equity_aum",
-    "asset_equity": "asset_equity",
-    "asset_debt": "asset_debt",
-    "asset_cash": "asset_cash",
-    "risk": "risk_of_the_fund",
-    "type": "type_of_fund",
-    "one_year_return": "one_year_returns",
-    "three_year_return": "three_year_returns",
-    "five_year_return": "five_year_returns",
-    "historical_nav_summary": "historical_nav_summary",
-    "top_holdings_summary": "top_holdings_summary",
-    "asset_allocation_summary": "asset_allocation_summary",
-    "sector_allocation_summary": "sector_allocation_summary"
-})
-
-# Clean and process Sheet2 (Historical_NAV)
-try:
-    sheet2 = sheet2.dropna(subset=["fund_name", "date", "nav"])
-    sheet2["date"] = pd.to_datetime(sheet2["date"], format="%d-%m-%Y %H:%M:%S", errors="coerce")
-    sheet2 = sheet2.dropna(subset=["date"])
-    sheet2["nav"] = pd.to_numeric(sheet2["nav"], errors="coerce").fillna(0)
-except KeyError as ke:
-    st.error(f"Error: {str(ke)}. Please check the column names in 'Historical_NAV' sheet and update the script.")
-    st.write("Columns in Historical_NAV sheet:", sheet2.columns.tolist())
-    st.stop()
-
-# Clean and process Sheet3 (Top_Holdings)
-try:
-    sheet3 = sheet3.dropna(subset=["fund_name", "company", "percentage"])
-    sheet3["percentage"] = pd.to_numeric(sheet3["percentage"], errors="coerce").fillna(0)
-except KeyError as ke:
-    st.error(f"Error: {str(ke)}. Please check the column names in 'Top_Holdings' sheet and update the script.")
-    st.write("Columns in Top_Holdings sheet:", sheet3.columns.tolist())
-    st.stop()
 
 # Sidebar for Filtering
 st.sidebar.header("Filter Funds")
@@ -110,15 +229,19 @@ min_sip_range = st.sidebar.slider("Minimum SIP Investment (₹)",
                                   max_value=float(sheet1["minimum_sip_funds_individual_lst"].max()), 
                                   value=(float(sheet1["minimum_sip_funds_individual_lst"].min()), float(sheet1["minimum_sip_funds_individual_lst"].max())))
 
-# Apply filters
-filtered_data = sheet1[
-    (sheet1["type_of_fund"].isin(type_filter)) &
-    (sheet1["risk_of_the_fund"].isin(risk_filter)) &
-    (sheet1["minimum_funds_individual_lst"] >= min_investment_range[0]) &
-    (sheet1["minimum_funds_individual_lst"] <= min_investment_range[1]) &
-    (sheet1["minimum_sip_funds_individual_lst"] >= min_sip_range[0]) &
-    (sheet1["minimum_sip_funds_individual_lst"] <= min_sip_range[1])
-]
+# Apply filters. Combining plain numpy bool arrays skips the index
+# alignment pandas does for each Series `&`.
+min_investment = sheet1["minimum_funds_individual_lst"].to_numpy()
+min_sip = sheet1["minimum_sip_funds_individual_lst"].to_numpy()
+mask = (
+    sheet1["type_of_fund"].isin(type_filter).to_numpy()
+    & sheet1["risk_of_the_fund"].isin(risk_filter).to_numpy()
+    & (min_investment >= min_investment_range[0])
+    & (min_investment <= min_investment_range[1])
+    & (min_sip >= min_sip_range[0])
+    & (min_sip <= min_sip_range[1])
+)
+filtered_data = sheet1.loc[mask]
 
 # Summary Metrics
 st.header("Summary Metrics")
@@ -153,46 +276,75 @@ st.header("Fund Comparison Table")
 comparison_columns = ["fund_name", "type_of_fund", "risk_of_the_fund", "aum_funds_individual_lst", "nav_funds_individual_lst",
                       "one_year_returns", "three_year_returns", "five_year_returns", "pe", "pb", "exit_load", 
                       "minimum_funds_individual_lst", "minimum_sip_funds_individual_lst", "equity_aum"]
-st.dataframe(filtered_data[comparison_columns].style.format({
-    "aum_funds_individual_lst": "{:.2f}",
-    "nav_funds_individual_lst": "{:.2f}",
-    "one_year_returns": "{:.2f}",
-    "three_year_returns": "{:.2f}",
-    "five_year_returns": "{:.2f}",
-    "pe": "{:.2f}",
-    "pb": "{:.2f}",
-    "exit_load": "{:.2f}",
-    "minimum_funds_individual_lst": "{:.2f}",
-    "minimum_sip_funds_individual_lst": "{:.2f}",
-    "equity_aum": "{:.2f}"
-}))
+# column_config formats client-side, avoiding the per-cell HTML a Styler
+# would generate on every rerun.
+st.dataframe(filtered_data[comparison_columns], column_config={
+    col: st.column_config.NumberColumn(format="%.2f")
+    for col in ["aum_funds_individual_lst", "nav_funds_individual_lst",
+                "one_year_returns", "three_year_returns", "five_year_returns",
+                "pe", "pb", "exit_load", "minimum_funds_individual_lst",
+                "minimum_sip_funds_individual_lst", "equity_aum"]
+})
 
 # Export Filtered Data
 st.header("Export Filtered Data")
-csv = filtered_data[comparison_columns].to_csv(index=False)
-st.download_button(label="Download Filtered Data as CSV", data=csv, file_name="filtered_funds.csv", mime="text/csv")
+# Passing a callable defers CSV serialization until the button is
+# actually clicked instead of rebuilding the string on every rerun.
+st.download_button(label="Download Filtered Data as CSV",
+                   data=lambda: filtered_data[comparison_columns].to_csv(index=False),
+                   file_name="filtered_funds.csv", mime="text/csv")
+
+# One fused pass over filtered_data computes every type_of_fund aggregate
+# the charts below need; each chart slices its columns out of this frame.
+type_agg = filtered_data.groupby("type_of_fund", observed=True, sort=False).agg(
+    one_year_returns=("one_year_returns", "mean"),
+    three_year_returns=("three_year_returns", "mean"),
+    five_year_returns=("five_year_returns", "mean"),
+    debt_per=("debt_per", "mean"),
+    equity_per=("equity_per", "mean"),
+    minimum_sip_funds_individual_lst=("minimum_sip_funds_individual_lst", "mean"),
+    count=("fund_name", "size"),
+).reset_index()
 
 # Returns Comparison by Fund Type
 st.header("Returns Comparison by Fund Type")
-returns_by_type = filtered_data.groupby("type_of_fund").agg({
-    "one_year_returns": "mean",
-    "three_year_returns": "mean",
-    "five_year_returns": "mean"
-}).reset_index()
-returns_melted = returns_by_type.melt(id_vars="type_of_fund", 
-                                      value_vars=["one_year_returns", "three_year_returns", "five_year_returns"],
-                                      var_name="Return Period", value_name="Returns (%)")
-fig_returns = px.bar(returns_melted, x="type_of_fund", y="Returns (%)", color="Return Period",
-                     title="Returns Comparison by Fund Type",
-                     labels={"type_of_fund": "Fund Type", "Returns (%)": "Returns (%)"},
-                     barmode="group",
-                     color_discrete_sequence=px.colors.sequential.Plasma)
-fig_returns.update_layout(legend_title_text="Return Period", height=600)
-st.plotly_chart(fig_returns, use_container_width=True)
+returns_by_type = type_agg[["type_of_fund", "one_year_returns", "three_year_returns", "five_year_returns"]]
+@st.cache_data(show_spinner=False, hash_funcs=DF_HASH)
+def build_returns_bar(returns_by_type):
+    # Direct go.Bar construction: no melt and none of the px figure
+    # introspection overhead.
+    fund_types = returns_by_type["type_of_fund"].astype(str)
+    colors = px.colors.sequential.Plasma
+    fig = go.Figure([
+        go.Bar(x=fund_types, y=returns_by_type[col], name=col, marker_color=colors[i])
+        for i, col in enumerate(["one_year_returns", "three_year_returns", "five_year_returns"])
+    ])
+    fig.update_layout(
+        title="Returns Comparison by Fund Type",
+        xaxis_title="Fund Type",
+        yaxis_title="Returns (%)",
+        barmode="group",
+        legend_title_text="Return Period",
+        height=600
+    )
+    return fig
+
+
+st.plotly_chart(build_returns_bar(returns_by_type), use_container_width=True)
+
+# The heatmap and the asset-allocation breakdown draw one x-category per
+# fund, which makes Plotly.js sluggish for large selections; cap them at
+# the 30 largest funds by AUM unless the user opts out.
+show_all_funds = st.sidebar.checkbox("Show all funds in per-fund charts", value=False)
+if show_all_funds or len(filtered_data) <= 30:
+    per_fund_chart_data = filtered_data
+else:
+    top_funds = filtered_data.nlargest(30, "aum_funds_individual_lst")["fund_name"]
+    per_fund_chart_data = filtered_data[filtered_data["fund_name"].isin(top_funds)]
 
 # Returns Heatmap Across Funds
 st.header("Returns Heatmap Across Funds")
-returns_heatmap_data = filtered_data[["fund_name", "one_year_returns", "three_year_returns", "five_year_returns"]]
+returns_heatmap_data = per_fund_chart_data[["fund_name", "one_year_returns", "three_year_returns", "five_year_returns"]]
 returns_heatmap_melted = returns_heatmap_data.melt(id_vars="fund_name", 
                                                     value_vars=["one_year_returns", "three_year_returns", "five_year_returns"],
                                                     var_name="Return Period", value_name="Returns (%)")
@@ -215,33 +367,29 @@ fig_heatmap.add_trace(
     )
 )
 
-# Add marginal histogram for x-axis (fund names)
-for period in returns_heatmap_melted["Return Period"].unique():
-    period_data = returns_heatmap_melted[returns_heatmap_melted["Return Period"] == period]["Returns (%)"]
-    fig_heatmap.add_trace(
-        go.Histogram(
-            y=period_data,
-            xaxis="x",
-            yaxis="y2",
-            marker=dict(color="skyblue"),
-            showlegend=False,
-            opacity=0.7
-        )
+# Marginal histograms: one aggregate trace per axis. The old loops added a
+# trace per return period and per fund (N+3 traces), which bogs down
+# Plotly.js; a single all-points histogram shows the same distribution.
+fig_heatmap.add_trace(
+    go.Histogram(
+        y=returns_heatmap_melted["Returns (%)"],
+        xaxis="x",
+        yaxis="y2",
+        marker=dict(color="skyblue"),
+        showlegend=False,
+        opacity=0.7
     )
-
-# Add marginal histogram for y-axis (return periods)
-for fund in returns_heatmap_melted["fund_name"].unique():
-    fund_data = returns_heatmap_melted[returns_heatmap_melted["fund_name"] == fund]["Returns (%)"]
-    fig_heatmap.add_trace(
-        go.Histogram(
-            x=fund_data,
-            xaxis="x2",
-            yaxis="y",
-            marker=dict(color="lightcoral"),
-            showlegend=False,
-            opacity=0.7
-        )
+)
+fig_heatmap.add_trace(
+    go.Histogram(
+        x=returns_heatmap_melted["Returns (%)"],
+        xaxis="x2",
+        yaxis="y",
+        marker=dict(color="lightcoral"),
+        showlegend=False,
+        opacity=0.7
     )
+)
 
 # Update layout for subplots with marginal histograms
 fig_heatmap.update_layout(
@@ -279,7 +427,12 @@ st.plotly_chart(fig_heatmap, use_container_width=True)
 # Risk vs. 5-Year Returns
 st.header("Risk vs. 5-Year Returns")
 risk_order = ["Low", "Low to Moderate", "Moderate", "Moderately High", "High", "Very High", "Unknown"]
-filtered_data["risk_numeric"] = filtered_data["risk_of_the_fund"].apply(lambda x: risk_order.index(x) + 1 if x in risk_order else 0)
+# Vectorized dict map ranks each risk label; unseen labels fall through to
+# 0 like the old per-row fallback.
+risk_rank = {risk: i + 1 for i, risk in enumerate(risk_order)}
+filtered_data["risk_numeric"] = (
+    filtered_data["risk_of_the_fund"].map(risk_rank).fillna(0).astype("int64")
+)
 fig_risk = px.scatter(
     filtered_data, 
     x="risk_numeric", 
@@ -291,7 +444,8 @@ fig_risk = px.scatter(
     title="Risk vs. 5-Year Returns",
     color_discrete_sequence=px.colors.sequential.Rainbow,
     height=600,
-    width=800
+    width=800,
+    render_mode="webgl"
 )
 fig_risk.update_traces(marker=dict(size=12, opacity=0.8))
 fig_risk.update_xaxes(tickvals=list(range(1, len(risk_order) + 1)), ticktext=risk_order)
@@ -317,7 +471,8 @@ fig_pe_pb = px.scatter(
     title="PE vs PB Comparison",
     color_discrete_sequence=px.colors.sequential.Plasma,
     height=600,
-    width=800
+    width=800,
+    render_mode="webgl"
 )
 fig_pe_pb.update_traces(marker=dict(size=12, opacity=0.8))
 fig_pe_pb.update_layout(
@@ -342,7 +497,8 @@ fig_ytm_maturity = px.scatter(
     title="Yield to Maturity vs Average Maturity",
     color_discrete_sequence=px.colors.sequential.Viridis,
     height=600,
-    width=800
+    width=800,
+    render_mode="webgl"
 )
 fig_ytm_maturity.update_traces(marker=dict(size=12, opacity=0.8))
 fig_ytm_maturity.update_layout(
@@ -356,99 +512,113 @@ st.plotly_chart(fig_ytm_maturity, use_container_width=True)
 
 # Risk vs Exit Load Bar Chart
 st.header("Risk vs Exit Load Comparison")
-risk_exit_load = filtered_data.groupby("risk_of_the_fund").agg({
+risk_exit_load = filtered_data.groupby("risk_of_the_fund", observed=True, sort=False).agg({
     "exit_load": "mean"
 }).reset_index()
-fig_risk_exit = px.bar(
-    risk_exit_load, 
-    x="risk_of_the_fund", 
-    y="exit_load",
-    labels={"risk_of_the_fund": "Risk Level", "exit_load": "Average Exit Load (%)"},
-    title="Average Exit Load by Risk Level",
-    color="risk_of_the_fund",
-    color_discrete_sequence=px.colors.sequential.Rainbow,
-    height=600
-)
-fig_risk_exit.update_layout(
-    title_font_size=18,
-    xaxis_title_font_size=14,
-    yaxis_title_font_size=14,
-    showlegend=False,
-    margin=dict(l=50, r=50, t=100, b=50)
-)
-st.plotly_chart(fig_risk_exit, use_container_width=True)
+@st.cache_data(show_spinner=False, hash_funcs=DF_HASH)
+def build_risk_exit_bar(risk_exit_load):
+    colors = px.colors.sequential.Rainbow
+    fig = go.Figure(go.Bar(
+        x=risk_exit_load["risk_of_the_fund"].astype(str),
+        y=risk_exit_load["exit_load"],
+        marker_color=[colors[i % len(colors)] for i in range(len(risk_exit_load))]
+    ))
+    fig.update_layout(
+        title="Average Exit Load by Risk Level",
+        xaxis_title="Risk Level",
+        yaxis_title="Average Exit Load (%)",
+        height=600,
+        title_font_size=18,
+        xaxis_title_font_size=14,
+        yaxis_title_font_size=14,
+        showlegend=False,
+        margin=dict(l=50, r=50, t=100, b=50)
+    )
+    return fig
+
+
+st.plotly_chart(build_risk_exit_bar(risk_exit_load), use_container_width=True)
 
 # Average Asset Allocation by Fund Type
 st.header("Average Asset Allocation by Fund Type")
-allocation_by_type = filtered_data.groupby("type_of_fund").agg({
-    "debt_per": "mean",
-    "equity_per": "mean"
-}).reset_index()
+allocation_by_type = type_agg[["type_of_fund", "debt_per", "equity_per"]]
 allocation_melted = allocation_by_type.melt(id_vars="type_of_fund", 
                                             value_vars=["debt_per", "equity_per"],
                                             var_name="Asset Type", value_name="Percentage")
-allocation_melted["Label"] = allocation_melted["type_of_fund"] + " " + allocation_melted["Asset Type"].str.replace("_per", "")
-fig_allocation = px.pie(
-    allocation_melted, 
-    names="Label", 
-    values="Percentage",
-    title="Average Asset Allocation by Fund Type",
-    color_discrete_sequence=px.colors.sequential.Plasma,
-    height=600
-)
-fig_allocation.update_layout(
-    title_font_size=18,
-    legend_title_font_size=14,
-    margin=dict(l=50, r=50, t=100, b=50)
-)
-st.plotly_chart(fig_allocation, use_container_width=True)
+allocation_melted["Label"] = allocation_melted["type_of_fund"].astype(str) + " " + allocation_melted["Asset Type"].str.replace("_per", "")
+@st.cache_data(show_spinner=False, hash_funcs=DF_HASH)
+def build_allocation_pie(allocation_melted):
+    fig = px.pie(
+        allocation_melted,
+        names="Label",
+        values="Percentage",
+        title="Average Asset Allocation by Fund Type",
+        color_discrete_sequence=px.colors.sequential.Plasma,
+        height=600
+    )
+    fig.update_layout(
+        title_font_size=18,
+        legend_title_font_size=14,
+        margin=dict(l=50, r=50, t=100, b=50)
+    )
+    return fig
+
+
+st.plotly_chart(build_allocation_pie(allocation_melted), use_container_width=True)
 
 # Fund Type Distribution
 st.header("Fund Type Distribution")
-fund_type_counts = filtered_data["type_of_fund"].value_counts().reset_index()
-fund_type_counts.columns = ["type_of_fund", "count"]
-fig_distribution = px.bar(
-    fund_type_counts, 
-    x="type_of_fund", 
-    y="count",
-    labels={"type_of_fund": "Fund Type", "count": "Number of Funds"},
-    title="Fund Type Distribution",
-    color="type_of_fund",
-    color_discrete_sequence=px.colors.sequential.Viridis,
-    height=600
-)
-fig_distribution.update_layout(
-    title_font_size=18,
-    xaxis_title_font_size=14,
-    yaxis_title_font_size=14,
-    showlegend=False,
-    margin=dict(l=50, r=50, t=100, b=50)
-)
-st.plotly_chart(fig_distribution, use_container_width=True)
+fund_type_counts = type_agg[["type_of_fund", "count"]].sort_values("count", ascending=False)
+@st.cache_data(show_spinner=False, hash_funcs=DF_HASH)
+def build_distribution_bar(fund_type_counts):
+    colors = px.colors.sequential.Viridis
+    fig = go.Figure(go.Bar(
+        x=fund_type_counts["type_of_fund"].astype(str),
+        y=fund_type_counts["count"],
+        marker_color=[colors[i % len(colors)] for i in range(len(fund_type_counts))]
+    ))
+    fig.update_layout(
+        title="Fund Type Distribution",
+        xaxis_title="Fund Type",
+        yaxis_title="Number of Funds",
+        height=600,
+        title_font_size=18,
+        xaxis_title_font_size=14,
+        yaxis_title_font_size=14,
+        showlegend=False,
+        margin=dict(l=50, r=50, t=100, b=50)
+    )
+    return fig
+
+
+st.plotly_chart(build_distribution_bar(fund_type_counts), use_container_width=True)
 
 # New Visualization: Minimum SIP Investment by Fund Type
 st.header("Minimum SIP Investment by Fund Type")
-sip_by_type = filtered_data.groupby("type_of_fund").agg({
-    "minimum_sip_funds_individual_lst": "mean"
-}).reset_index()
-fig_sip = px.bar(
-    sip_by_type, 
-    x="type_of_fund", 
-    y="minimum_sip_funds_individual_lst",
-    labels={"type_of_fund": "Fund Type", "minimum_sip_funds_individual_lst": "Average Minimum SIP Investment (₹)"},
-    title="Average Minimum SIP Investment by Fund Type",
-    color="type_of_fund",
-    color_discrete_sequence=px.colors.sequential.Viridis,
-    height=600
-)
-fig_sip.update_layout(
-    title_font_size=18,
-    xaxis_title_font_size=14,
-    yaxis_title_font_size=14,
-    showlegend=False,
-    margin=dict(l=50, r=50, t=100, b=50)
-)
-st.plotly_chart(fig_sip, use_container_width=True)
+sip_by_type = type_agg[["type_of_fund", "minimum_sip_funds_individual_lst"]]
+@st.cache_data(show_spinner=False, hash_funcs=DF_HASH)
+def build_sip_bar(sip_by_type):
+    colors = px.colors.sequential.Viridis
+    fig = go.Figure(go.Bar(
+        x=sip_by_type["type_of_fund"].astype(str),
+        y=sip_by_type["minimum_sip_funds_individual_lst"],
+        marker_color=[colors[i % len(colors)] for i in range(len(sip_by_type))]
+    ))
+    fig.update_layout(
+        title="Average Minimum SIP Investment by Fund Type",
+        xaxis_title="Fund Type",
+        yaxis_title="Average Minimum SIP Investment (₹)",
+        height=600,
+        title_font_size=18,
+        xaxis_title_font_size=14,
+        yaxis_title_font_size=14,
+        showlegend=False,
+        margin=dict(l=50, r=50, t=100, b=50)
+    )
+    return fig
+
+
+st.plotly_chart(build_sip_bar(sip_by_type), use_container_width=True)
 
 # New Visualization: Equity AUM vs Total AUM
 st.header("Equity AUM vs Total AUM")
@@ -463,7 +633,8 @@ fig_equity_aum = px.scatter(
     title="Equity AUM vs Total AUM",
     color_discrete_sequence=px.colors.sequential.Rainbow,
     height=600,
-    width=800
+    width=800,
+    render_mode="webgl"
 )
 fig_equity_aum.update_traces(marker=dict(size=12, opacity=0.8))
 fig_equity_aum.update_layout(
@@ -477,7 +648,7 @@ st.plotly_chart(fig_equity_aum, use_container_width=True)
 
 # New Visualization: Asset Allocation Breakdown Across Funds
 st.header("Asset Allocation Breakdown Across Funds")
-asset_allocation_data = filtered_data[["fund_name", "asset_equity", "asset_debt", "asset_cash"]]
+asset_allocation_data = per_fund_chart_data[["fund_name", "asset_equity", "asset_debt", "asset_cash"]]
 asset_allocation_melted = asset_allocation_data.melt(id_vars="fund_name", 
                                                      value_vars=["asset_equity", "asset_debt", "asset_cash"],
                                                      var_name="Asset Type", value_name="Percentage")
@@ -557,15 +728,9 @@ st.header("Sector Allocation for Selected Fund")
 sector_summary = fund_data["sector_allocation_summary"]
 if sector_summary and sector_summary != "N/A":
     # Parse sector allocation summary (e.g., "Energy (39.18%); Capital Goods (28.41%); ...")
-    sectors = []
-    percentages = []
-    for entry in sector_summary.split(";"):
-        if "(" in entry and ")" in entry:
-            sector = entry.split("(")[0].strip()
-            percentage = float(entry.split("(")[1].replace("%)", "").strip())
-            sectors.append(sector)
-            percentages.append(percentage)
-    sector_data = pd.DataFrame({"Sector": sectors, "Percentage": percentages})
+    sector_data = pd.DataFrame(SECTOR_PAT.findall(sector_summary), columns=["Sector", "Percentage"])
+    sector_data["Sector"] = sector_data["Sector"].str.strip()
+    sector_data["Percentage"] = sector_data["Percentage"].astype(float)
     fig_sector = px.treemap(
         sector_data, 
         path=["Sector"], 
@@ -588,16 +753,12 @@ st.header("Future Value Prediction Calculator")
 investment_amount = st.number_input("Investment Amount (₹)", min_value=0.0, value=10000.0)
 investment_duration = st.number_input("Investment Duration (Years)", min_value=1, value=5)
 
-fund_nav_data = sheet2[sheet2["fund_name"] == selected_fund].sort_values("date")
-if len(fund_nav_data) >= 2:
-    first_entry = fund_nav_data.iloc[0]
-    last_entry = fund_nav_data.iloc[-1]
-    start_nav = first_entry["nav"]
-    end_nav = last_entry["nav"]
-    start_date = first_entry["date"]
-    end_date = last_entry["date"]
-    years = (end_date - start_date).days / 365.25
-    cagr = (end_nav / start_nav) ** (1 / years) - 1 if years > 0 and start_nav > 0 and end_nav > 0 else 0
+if selected_fund in sheet2.index:
+    fund_nav_data = sheet2.loc[[selected_fund]].reset_index()
+else:
+    fund_nav_data = sheet2.iloc[0:0].reset_index()
+if selected_fund in cagr_table.index and cagr_table.loc[selected_fund, "count"] >= 2:
+    cagr = cagr_table.loc[selected_fund, "cagr"]
 else:
     valid_returns = [fund_data["one_year_returns"], fund_data["three_year_returns"], fund_data["five_year_returns"]]
     valid_returns = [r for r in valid_returns if r != 0]
@@ -610,28 +771,38 @@ if st.button("Calculate Future Value"):
 # Historical NAV Trend
 st.header("Historical NAV Trend")
 if not fund_nav_data.empty:
-    fig_nav = px.line(
-        fund_nav_data, 
-        x="date", 
-        y="nav",
-        labels={"date": "Date", "nav": "NAV (₹)"},
-        title=f"Historical NAV Trend for {selected_fund}",
-        color_discrete_sequence=px.colors.sequential.Plasma,
-        height=600
-    )
-    fig_nav.update_layout(
-        title_font_size=18,
-        xaxis_title_font_size=14,
-        yaxis_title_font_size=14,
-        margin=dict(l=50, r=50, t=100, b=50)
-    )
+    nav_plot_data = lttb_downsample(fund_nav_data, "date", "nav")
+    # Build the styled figure once per session; later reruns only swap the
+    # data arrays and title instead of re-running the px builder.
+    if "fig_nav_template" not in st.session_state:
+        fig = go.Figure(go.Scatter(
+            mode="lines",
+            line=dict(color=px.colors.sequential.Plasma[0])
+        ))
+        fig.update_layout(
+            xaxis_title="Date",
+            yaxis_title="NAV (₹)",
+            height=600,
+            title_font_size=18,
+            xaxis_title_font_size=14,
+            yaxis_title_font_size=14,
+            margin=dict(l=50, r=50, t=100, b=50)
+        )
+        st.session_state["fig_nav_template"] = fig
+    fig_nav = st.session_state["fig_nav_template"]
+    fig_nav.data[0].x = nav_plot_data["date"].to_numpy()
+    fig_nav.data[0].y = nav_plot_data["nav"].to_numpy()
+    fig_nav.update_layout(title_text=f"Historical NAV Trend for {selected_fund}")
     st.plotly_chart(fig_nav, use_container_width=True)
 else:
     st.write(f"No historical NAV data available for {selected_fund}.")
 
 # Top Holdings
 st.header("Top Holdings")
-fund_holdings = sheet3[sheet3["fund_name"] == selected_fund].sort_values("percentage", ascending=False).head(5)
+if selected_fund in sheet3.index:
+    fund_holdings = sheet3.loc[[selected_fund]].reset_index().sort_values("percentage", ascending=False).head(5)
+else:
+    fund_holdings = sheet3.iloc[0:0].reset_index()
 if not fund_holdings.empty:
     fig_holdings = px.bar(
         fund_holdings, 
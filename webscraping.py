@@ -1,12 +1,28 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
 import pandas as pd
 import numpy as np
 import logging
+import threading
 import time
+import random
 import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from urllib.error import HTTPError
-from datetime import datetime
+
+try:
+    import lxml  # noqa: F401  # C parser, ~10x faster than html.parser
+    BS_PARSER = 'lxml'
+except ImportError:
+    BS_PARSER = 'html.parser'
+
+try:
+    import orjson  # Much faster than stdlib json for the nested NAV/holdings data
+except ImportError:
+    orjson = None
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -14,35 +30,99 @@ logger = logging.getLogger(__name__)
 
 # Constants
 BASE_URL = "https://groww.in/mutual-funds/filter?q=&fundSize=&pageNo={}&sortBy=0"
-DELAY_SECONDS = 3  # Increased to 3 seconds to reduce rate limiting
-MAX_FUNDS = 200    # Limit to 200 schemes as per user requirement
+MAX_FUNDS = 200      # Limit to 200 schemes as per user requirement
+OVERVIEW_PAGES = 15  # ~20 funds per page, so 15 pages comfortably covers MAX_FUNDS
+MAX_WORKERS = 16   # Concurrent fund workers; HTTP itself is capped by _HOST_GATE
+
+# Caps in-flight HTTP requests across all worker threads so a wide executor
+# never hammers the host with more than a few concurrent connections.
+_HOST_GATE = threading.Semaphore(4)
+
+# One pooled session shared by every thread: connections are reused instead
+# of paying a fresh TCP/TLS handshake per request, and transient failures
+# are retried with backoff at the transport layer.
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+})
+_adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32,
+                       max_retries=Retry(total=3, backoff_factor=1))
+_SESSION.mount('https://', _adapter)
+_SESSION.mount('http://', _adapter)
+
+# Precompiled patterns, hoisted out of the per-element loops
+PCT_RE = re.compile(r'(\d+\.\d+)%')
+SCHEME_CODE_RE = re.compile(rb'"scheme_code":"(\d+)"')
+MONEY_JUNK_RE = re.compile(r'[₹,\s]|Cr')
+# Matches the filler words only as whole hyphen-separated tokens, unlike the
+# old str.replace chain which also mangled names like "directional".
+SLUG_SUFFIX_RE = re.compile(r'-(fund|direct|growth|plan|scheme)(?=-|$)')
+
+# Raw page bytes keyed by URL. BeautifulSoup objects are mutable, so the
+# cache holds the immutable response content and each caller re-parses —
+# parsing is cheap next to the network round-trip it saves.
+_PAGE_CACHE = {}
+
+def fetch_content(url):
+    """Fetch a webpage's raw bytes, served from the module cache when possible."""
+    content = _PAGE_CACHE.get(url)
+    if content is None:
+        try:
+            with _HOST_GATE:
+                response = _SESSION.get(url, timeout=10)
+            response.raise_for_status()
+            logger.info(f"Successfully fetched {url}")
+            content = response.content
+            _PAGE_CACHE[url] = content
+        except (requests.RequestException, HTTPError) as e:
+            logger.error(f"Failed to fetch {url}: {e}")
+            return None
+    return content
 
 def fetch_page(url):
     """Fetch a webpage and return its BeautifulSoup object with error handling."""
-    try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        response = requests.get(url, timeout=10, headers=headers)
-        response.raise_for_status()
-        logger.info(f"Successfully fetched {url}")
-        soup = BeautifulSoup(response.content, 'html.parser')
-        logger.debug(f"Page content snippet: {str(soup)[:500]}")
-        return soup
-    except (requests.RequestException, HTTPError) as e:
-        logger.error(f"Failed to fetch {url}: {e}")
+    content = fetch_content(url)
+    if content is None:
         return None
-
+    soup = BeautifulSoup(content, BS_PARSER)
+    logger.debug(f"Page content snippet: {str(soup)[:500]}")
+    return soup
+
+AMFI_NAV_URL = "https://www.amfiindia.com/spages/NAVAll.txt"
+_AMFI_NAV_TABLE = None
+_AMFI_NAV_LOCK = threading.Lock()
+
+def _load_amfi_nav_table():
+    """Download and parse NAVAll.txt once, grouped into a dict by scheme code.
+
+    The file is multi-MB and covers every scheme, so per-scheme fallbacks
+    after the first one become dictionary lookups instead of re-downloads.
+    """
+    global _AMFI_NAV_TABLE
+    with _AMFI_NAV_LOCK:
+        if _AMFI_NAV_TABLE is None:
+            df = pd.read_csv(AMFI_NAV_URL, sep=';', skiprows=1,
+                             names=['Scheme Code', 'ISIN', 'Name', 'NAV', 'Date'],
+                             usecols=['Scheme Code', 'NAV', 'Date'])
+            # Section-header lines parse as garbage rows; coercing drops them.
+            df['Scheme Code'] = pd.to_numeric(df['Scheme Code'], errors='coerce')
+            df['NAV'] = pd.to_numeric(df['NAV'], errors='coerce')
+            df['Date'] = pd.to_datetime(df['Date'], format='%d-%b-%Y', errors='coerce')
+            df = df.dropna()
+            _AMFI_NAV_TABLE = {code: group for code, group in df.groupby('Scheme Code')}
+    return _AMFI_NAV_TABLE
+
+@lru_cache(maxsize=512)
 def fetch_amfi_nav(scheme_code, start_date='2024-05-05', end_date='2025-05-05'):
     """Fetch historical NAV data from AMFI as a fallback."""
-    url = "https://www.amfiindia.com/spages/NAVAll.txt"
     try:
-        df = pd.read_csv(url, sep=';', skiprows=1, names=['Scheme Code', 'ISIN', 'Name', 'NAV', 'Date'])
-        df = df[df['Scheme Code'] == int(scheme_code)]
-        df['Date'] = pd.to_datetime(df['Date'], format='%d-%b-%Y')
-        df = df[(df['Date'] >= start_date) & (df['Date'] <= end_date)]
-        nav_data = df[['Date', 'NAV']].to_dict(orient='records')
-        formatted_data = [{'date': str(entry['Date'])[:10], 'nav': float(entry['NAV'])} for entry in nav_data]
+        df = _load_amfi_nav_table().get(int(scheme_code))
+        if df is not None:
+            df = df[(df['Date'] >= start_date) & (df['Date'] <= end_date)]
+            formatted_data = [{'date': date.strftime('%Y-%m-%d'), 'nav': float(nav)}
+                              for date, nav in zip(df['Date'], df['NAV'])]
+        else:
+            formatted_data = []
         logger.info(f"Fetched {len(formatted_data)} NAV entries from AMFI for scheme {scheme_code}")
         return formatted_data
     except (pd.errors.EmptyDataError, requests.RequestException, ValueError) as e:
@@ -56,34 +136,33 @@ def extract_historical_nav(scheme_code, months=12):
         return []
 
     url = f"https://groww.in/v1/api/data/mf/web/v1/scheme/{scheme_code}/graph?benchmark=false&months={months}"
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
     try:
-        response = requests.get(url, timeout=10, headers=headers)
+        with _HOST_GATE:
+            response = _SESSION.get(url, timeout=10)
         response.raise_for_status()
-        data = response.json()
+        data = (orjson.loads(response.content) if orjson is not None
+                else response.json())
 
         nav_data = data.get('folio', {}).get('data', [])
         if not nav_data:
             logger.warning(f"No NAV data found in response for scheme {scheme_code}")
             return []
 
-        formatted_data = []
-        for entry in nav_data:
-            if isinstance(entry, list) and len(entry) == 2:
-                try:
-                    timestamp_ms = entry[0]
-                    nav_value = float(entry[1])
-                    timestamp_s = timestamp_ms / 1000
-                    date_str = datetime.utcfromtimestamp(timestamp_s).strftime('%Y-%m-%d')
-                    formatted_data.append({'date': date_str, 'nav': nav_value})
-                except (ValueError, TypeError) as e:
-                    logger.warning(f"Invalid NAV entry for scheme {scheme_code}: {entry}, error: {e}")
-                    continue
-            else:
-                logger.warning(f"Unexpected NAV entry format for scheme {scheme_code}: {entry}")
-                continue
+        # ~360 daily points per scheme: one vectorized pass over the whole
+        # block replaces per-entry datetime construction and strftime calls.
+        # Shape/dtype coercion up front stands in for the old per-entry checks.
+        try:
+            arr = np.asarray(nav_data, dtype=object)
+            if arr.ndim != 2 or arr.shape[1] != 2:
+                raise ValueError(f"unexpected NAV data shape {arr.shape}")
+            ts_ms = arr[:, 0].astype('int64')
+            nav_vals = arr[:, 1].astype('float64')
+        except (ValueError, TypeError) as e:
+            logger.warning(f"Malformed NAV data for scheme {scheme_code}: {e}")
+            return []
+        dates = pd.to_datetime(ts_ms, unit='ms', utc=True).strftime('%Y-%m-%d')
+        formatted_data = [{'date': date_str, 'nav': nav_value}
+                          for date_str, nav_value in zip(dates, nav_vals.tolist())]
 
         logger.info(f"Fetched {len(formatted_data)} NAV entries from Groww for scheme {scheme_code}")
         return formatted_data
@@ -183,56 +262,47 @@ def extract_fund_overview(page_no):
     logger.info(f"Fetched page {page_no + 1}, found {len(funds_data)} funds")
     return funds_data
 
+def _parse_money(text):
+    """Parse a Groww money/number string ('₹1,234.5 Cr') into a float."""
+    try:
+        return float(MONEY_JUNK_RE.sub('', text))
+    except ValueError:
+        return np.nan
+
 def extract_detailed_fund_data(url):
     """Extract detailed data (AUM, NAV, minimum investment, minimum SIP investment, rating, expense ratio, exit load)."""
     soup = fetch_page(url)
     if not soup:
         return [np.nan] * 7
 
-    aum = np.nan
-    all_elements = soup.find_all(['td', 'div', 'span'], class_=['bodyLarge', 'bodyLargeHeavy', 'contentPrimary'])
-    for elem in all_elements:
+    # One compiled CSS pass collects every candidate value element; the
+    # sibling combinator means the per-element label walk only runs for
+    # elements that actually have a labelled sibling. Values are grouped
+    # under their label text so each field below is a dict scan, not a DOM
+    # scan.
+    pairs = {}
+    selector = (':is(td, div, span):is(.contentSecondary, .bodyLarge)'
+                ' ~ :is(td, div, span):is(.bodyLarge, .bodyLargeHeavy, .contentPrimary)')
+    for elem in soup.select(selector):
         previous = elem.find_previous_sibling(['td', 'div', 'span'], class_=['contentSecondary', 'bodyLarge'])
-        if previous and 'Fund size' in previous.text:
-            text = elem.text.strip()
-            try:
-                aum = float(text.replace('₹', '').replace(',', '').replace('Cr', ''))
-                break
-            except ValueError:
-                continue
-
-    nav = np.nan
-    for elem in all_elements:
-        previous = elem.find_previous_sibling(['td', 'div', 'span'], class_=['contentSecondary', 'bodyLarge'])
-        if previous and 'NAV' in previous.text:
-            text = elem.text.strip()
-            try:
-                nav = float(text.replace('₹', '').replace(',', ''))
-                break
-            except ValueError:
-                continue
+        if previous:
+            pairs.setdefault(previous.text, []).append(elem.text.strip())
+
+    def lookup(label):
+        # First value whose label matches and parses, mirroring the old
+        # break-on-success loops.
+        for lab, values in pairs.items():
+            if label in lab:
+                for value in values:
+                    number = _parse_money(value)
+                    if not np.isnan(number):
+                        return number
+        return np.nan
 
-    minimum = np.nan
-    minimum_sip = np.nan
-    min_elements = soup.find_all('td', class_='bodyLargeHeavy')
-    for elem in min_elements:
-        text = elem.text.strip()
-        parent = elem.find_previous_sibling('td', class_='contentSecondary bodyLarge')
-        if parent and 'Min. for 1st investment' in parent.text:
-            try:
-                minimum = float(text.replace('₹', '').replace(',', ''))
-                break
-            except ValueError:
-                continue
-    for elem in min_elements:
-        text = elem.text.strip()
-        parent = elem.find_previous_sibling('td', class_='contentSecondary bodyLarge')
-        if parent and 'Min. for SIP' in parent.text:
-            try:
-                minimum_sip = float(text.replace('₹', '').replace(',', ''))
-                break
-            except ValueError:
-                continue
+    aum = lookup('Fund size')
+    nav = lookup('NAV')
+    minimum = lookup('Min. for 1st investment')
+    minimum_sip = lookup('Min. for SIP')
     # If minimum wasn't found, fall back to SIP amount for minimum (existing logic)
     if np.isnan(minimum):
         minimum = minimum_sip
@@ -258,7 +328,7 @@ def extract_detailed_fund_data(url):
             if 'No exit load' in text or '0%' in text:
                 exit_load = 0.0
                 break
-            match = re.search(r'(\d+\.\d+)%', text)
+            match = PCT_RE.search(text)
             if match:
                 try:
                     exit_load = float(match.group(1))
@@ -270,7 +340,7 @@ def extract_detailed_fund_data(url):
     for elem in exit_load_elements:
         text = elem.text.strip()
         if 'Expense ratio' in text:
-            match = re.search(r'(\d+\.\d+)%', text)
+            match = PCT_RE.search(text)
             if match:
                 try:
                     expense_ratio = float(match.group(1))
@@ -280,18 +350,20 @@ def extract_detailed_fund_data(url):
 
     return [aum, nav, minimum, minimum_sip, rating, expense_ratio, exit_load]
 
+@lru_cache(maxsize=512)
 def extract_scheme_code(url):
-    """Extract scheme_code from a fund page's script tags."""
-    soup = fetch_page(url)
-    if not soup:
+    """Extract scheme_code from a fund page's raw HTML."""
+    content = fetch_content(url)
+    if content is None:
         return np.nan
-    scripts = soup.find_all('script')
-    for script in scripts:
-        match = re.search(r'"scheme_code":"(\d+)"', str(script))
-        if match:
-            return match.group(1)
+    # The code sits in an embedded JSON blob; scanning the raw bytes skips
+    # building a DOM and serializing every <script> tag back to str.
+    match = SCHEME_CODE_RE.search(content)
+    if match:
+        return match.group(1).decode()
     return np.nan
 
+@lru_cache(maxsize=512)
 def extract_portfolio_stats(scheme_code, fund_type, retries=3, retry_delay=5):
     """Fetch and extract portfolio statistics, asset allocation, and equity sector allocation from the Groww API."""
     if not scheme_code or pd.isna(scheme_code):
@@ -309,14 +381,13 @@ def extract_portfolio_stats(scheme_code, fund_type, retries=3, retry_delay=5):
         }
 
     url = f"https://groww.in/v1/api/data/mf/web/v1/scheme/portfolio/{scheme_code}/stats"
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
     for attempt in range(retries):
         try:
-            response = requests.get(url, timeout=10, headers=headers)
+            with _HOST_GATE:
+                response = _SESSION.get(url, timeout=10)
             response.raise_for_status()
-            data = response.json()
+            data = (orjson.loads(response.content) if orjson is not None
+                    else response.json())
 
             # Extract portfolio stats (existing logic)
             stats = {
@@ -383,8 +454,18 @@ def extract_portfolio_stats(scheme_code, fund_type, retries=3, retry_delay=5):
         except (ValueError, KeyError, requests.RequestException) as e:
             logger.warning(f"Attempt {attempt + 1}/{retries} - Failed to fetch portfolio stats for scheme {scheme_code}: {e}")
             if attempt < retries - 1:
-                logger.info(f"Retrying after {retry_delay} seconds...")
-                time.sleep(retry_delay)
+                # Exponential back-off with jitter so retries spread out
+                # instead of re-hitting a rate limit in lockstep; a server
+                # Retry-After header overrides the computed wait.
+                wait = min(60, retry_delay * 2 ** attempt + random.random())
+                retry_after = getattr(getattr(e, 'response', None), 'headers', {}).get('Retry-After')
+                if retry_after is not None:
+                    try:
+                        wait = min(60, float(retry_after))
+                    except ValueError:
+                        pass
+                logger.info(f"Retrying after {wait:.1f} seconds...")
+                time.sleep(wait)
             else:
                 logger.error(f"All retry attempts failed for scheme {scheme_code}")
                 return {
@@ -401,14 +482,19 @@ def extract_portfolio_stats(scheme_code, fund_type, retries=3, retry_delay=5):
 
 def process_returns(returns_list, expected_count):
     """Process returns list into 1Y, 3Y, 5Y lists, ensuring length matches expected_count."""
-    one_year, three_year, five_year = [], [], []
-    for returns in returns_list:
-        one_year_val = returns[0] if returns[0] != 'NA' else np.nan
-        three_year_val = returns[1] if returns[1] != 'NA' else np.nan
-        five_year_val = returns[2] if returns[2] != 'NA' else np.nan
-        one_year.append(float(one_year_val.rstrip('%')) if isinstance(one_year_val, str) and one_year_val.endswith('%') else one_year_val)
-        three_year.append(float(three_year_val.rstrip('%')) if isinstance(three_year_val, str) and three_year_val.endswith('%') else three_year_val)
-        five_year.append(float(five_year_val.rstrip('%')) if isinstance(five_year_val, str) and five_year_val.endswith('%') else five_year_val)
+    if returns_list:
+        # Vectorized over the whole (n, 3) block: 'NA' becomes NaN,
+        # '12.3%'-style strings lose the suffix and become floats, anything
+        # else passes through unchanged like the old per-row branches.
+        arr = np.asarray(returns_list, dtype=object)
+        as_str = arr.astype(str)
+        pct = np.char.endswith(as_str, '%')
+        values = arr.copy()
+        values[as_str == 'NA'] = np.nan
+        values[pct] = np.char.rstrip(as_str[pct], '%').astype(np.float64)
+        one_year, three_year, five_year = (values[:, i].tolist() for i in range(3))
+    else:
+        one_year, three_year, five_year = [], [], []
 
     for lst in [one_year, three_year, five_year]:
         while len(lst) < expected_count:
@@ -416,26 +502,31 @@ def process_returns(returns_list, expected_count):
 
     return one_year, three_year, five_year
 
+@lru_cache(maxsize=1024)
 def normalize_link(link):
     """Normalize the link by extracting the core slug to prevent duplicates."""
     slug = link.split('mutual-funds/')[-1].split('?')[0]
-    suffixes = ['-fund', '-direct', '-growth', '-plan', '-scheme']
-    for suffix in suffixes:
-        slug = slug.replace(suffix, '')
-    slug = '-'.join(filter(None, slug.split('-')))
-    return slug
+    slug = SLUG_SUFFIX_RE.sub('', slug)
+    return '-'.join(filter(None, slug.split('-')))
 
 def main():
     logger.info("Starting data extraction process")
 
+    # Overview pages are independent, so fetch the whole window concurrently
+    # instead of page-sleep-page; _HOST_GATE keeps the request rate bounded.
+    # Deduplication happens afterwards in page order, so the result matches
+    # what the old serial loop produced.
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        pages = list(executor.map(extract_fund_overview, range(OVERVIEW_PAGES)))
+
     all_funds = []
-    page_no = 0
     seen = set()
-    while len(all_funds) < MAX_FUNDS:
-        funds_data = extract_fund_overview(page_no)
-        if not funds_data:
-            logger.warning(f"No more funds to fetch after page {page_no + 1}")
+    for page_no, funds_data in enumerate(pages):
+        if len(all_funds) >= MAX_FUNDS:
             break
+        if not funds_data:
+            logger.warning(f"No funds found on page {page_no + 1}")
+            continue
 
         for fund in funds_data:
             key = (fund['name'].strip(), normalize_link(fund['link']))
@@ -445,9 +536,6 @@ def main():
                 if len(all_funds) >= MAX_FUNDS:
                     break
 
-        page_no += 1
-        time.sleep(DELAY_SECONDS)
-
     num_funds = len(all_funds)
     logger.info(f"Processing {num_funds} funds after deduplication")
 
@@ -459,56 +547,67 @@ def main():
 
     one_year_returns, three_year_returns, five_year_returns = process_returns(all_returns, num_funds)
 
-    aum_list, nav_list, min_inv_list, min_sip_list, rating_list, exp_ratio_list, exit_load_list = [], [], [], [], [], [], []
+    # Numeric columns go straight into preallocated float32 arrays — packed
+    # memory instead of boxed Python floats, and pd.DataFrame wraps them
+    # without a type-inference pass. Nested/object columns stay lists.
+    numeric_cols = ('aum', 'nav', 'minimum_investment', 'minimum_sip_investment',
+                    'rating', 'exp_ratio', 'exit_load', 'pe', 'pb', 'debt_per',
+                    'equity_per', 'average_maturity', 'yield_to_maturity', 'equity_aum')
+    arrays = {col: np.full(num_funds, np.nan, dtype=np.float32) for col in numeric_cols}
     scheme_codes = []
     historical_navs = []
     top_holdings_list = []
     # Lists for holding analysis data
     asset_allocations = []
     sector_allocations = []
-    equity_aums = []
 
-    for fund in all_funds:
+    def process_fund(fund):
+        """Run every per-fund fetch for one fund; executed on a worker thread."""
         link = fund['link']
-        aum, nav, minimum, minimum_sip, rating, exp_ratio, exit_load = extract_detailed_fund_data(link)
-        aum_list.append(aum)
-        nav_list.append(nav)
-        min_inv_list.append(minimum)
-        min_sip_list.append(minimum_sip)
-        rating_list.append(rating)
-        exp_ratio_list.append(exp_ratio)
-        exit_load_list.append(exit_load)
+        detail = extract_detailed_fund_data(link)
+        # The detail call above populated _PAGE_CACHE for this link, so the
+        # scheme-code scan and the holdings scrape below reuse those bytes
+        # instead of re-fetching the fund page.
         scheme_code = extract_scheme_code(link)
-        scheme_codes.append(scheme_code)
-
         nav_data = extract_historical_nav(scheme_code, months=12)
-        historical_navs.append(nav_data)
-
         top_holdings = extract_top_holdings(scheme_code, fund_link=link)
-        top_holdings_list.append(top_holdings)
-
-        # Extract portfolio stats and holding analysis
         stats = extract_portfolio_stats(scheme_code, fund['type'])
+        return detail, scheme_code, nav_data, top_holdings, stats
+
+    # The per-fund work is pure HTTP wait; threads overlap those round-trips
+    # while MAX_WORKERS keeps the load on groww.in bounded. executor.map
+    # preserves fund order, so the lists below stay aligned.
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        results = list(executor.map(process_fund, all_funds))
+
+    for i, (detail, scheme_code, nav_data, top_holdings, stats) in enumerate(results):
+        (arrays['aum'][i], arrays['nav'][i], arrays['minimum_investment'][i],
+         arrays['minimum_sip_investment'][i], arrays['rating'][i],
+         arrays['exp_ratio'][i], arrays['exit_load'][i]) = detail
+        scheme_codes.append(scheme_code)
+        historical_navs.append(nav_data)
+        top_holdings_list.append(top_holdings)
         asset_allocations.append(stats['asset_allocation'])
         sector_allocations.append(stats['sector_allocation'])
-        equity_aums.append(stats['equity_aum'])
-
-        time.sleep(DELAY_SECONDS)
+        for col in ('equity_aum', 'pe', 'pb', 'debt_per', 'equity_per',
+                    'average_maturity', 'yield_to_maturity'):
+            value = stats[col]
+            arrays[col][i] = np.nan if value is None else value
 
     analysis = {
         'name': all_names,
-        'aum': aum_list,
-        'nav': nav_list,
-        'exit_load': exit_load_list,
-        'rating': rating_list,
-        'minimum_investment': min_inv_list,
-        'minimum_sip_investment': min_sip_list,
-        'pe': [stats['pe'] for stats in [extract_portfolio_stats(code, fund['type']) for code, fund in zip(scheme_codes, all_funds)]],
-        'pb': [stats['pb'] for stats in [extract_portfolio_stats(code, fund['type']) for code, fund in zip(scheme_codes, all_funds)]],
-        'debt_per': [stats['debt_per'] for stats in [extract_portfolio_stats(code, fund['type']) for code, fund in zip(scheme_codes, all_funds)]],
-        'equity_per': [stats['equity_per'] for stats in [extract_portfolio_stats(code, fund['type']) for code, fund in zip(scheme_codes, all_funds)]],
-        'average_maturity': [stats['average_maturity'] for stats in [extract_portfolio_stats(code, fund['type']) for code, fund in zip(scheme_codes, all_funds)]],
-        'yield_to_maturity': [stats['yield_to_maturity'] for stats in [extract_portfolio_stats(code, fund['type']) for code, fund in zip(scheme_codes, all_funds)]],
+        'aum': arrays['aum'],
+        'nav': arrays['nav'],
+        'exit_load': arrays['exit_load'],
+        'rating': arrays['rating'],
+        'minimum_investment': arrays['minimum_investment'],
+        'minimum_sip_investment': arrays['minimum_sip_investment'],
+        'pe': arrays['pe'],
+        'pb': arrays['pb'],
+        'debt_per': arrays['debt_per'],
+        'equity_per': arrays['equity_per'],
+        'average_maturity': arrays['average_maturity'],
+        'yield_to_maturity': arrays['yield_to_maturity'],
         'risk': all_risks,
         'type': all_types,
         'one_year_return': one_year_returns,
@@ -520,7 +619,7 @@ def main():
         # Fields for holding analysis
         'asset_allocation': asset_allocations,
         'sector_allocation': sector_allocations,
-        'equity_aum': equity_aums
+        'equity_aum': arrays['equity_aum']
     }
 
     logger.info("Lengths of all lists in analysis dictionary:")
@@ -529,8 +628,25 @@ def main():
 
     try:
         analysis_df = pd.DataFrame(analysis)
-        analysis_df.to_excel("raw_data.xlsx", index=False)
-        logger.info("Raw data for 200 schemes has been extracted and saved to raw_data.xlsx")
+        # Store the nested columns as compact JSON strings rather than letting
+        # to_excel repr() them — smaller cells, and datapreprocess parses JSON
+        # directly. NaN serializes to null, which parses back as missing.
+        if orjson is not None:
+            for col in ('historical_nav', 'top_holdings', 'asset_allocation', 'sector_allocation'):
+                analysis_df[col] = [orjson.dumps(v).decode() for v in analysis_df[col]]
+        def write_workbook():
+            try:
+                # xlsxwriter streams rows out instead of building openpyxl's
+                # in-memory XML tree, which dominates export time here.
+                analysis_df.to_excel("raw_data.xlsx", index=False, engine='xlsxwriter')
+            except ImportError:
+                analysis_df.to_excel("raw_data.xlsx", index=False)
+            logger.info("Raw data for 200 schemes has been extracted and saved to raw_data.xlsx")
+
+        # Nothing after this point reads the workbook, so the write happens
+        # on a background thread; non-daemon so the interpreter still waits
+        # for the file to finish before exiting.
+        threading.Thread(target=write_workbook, daemon=False).start()
         logger.info(f"Total number of schemes extracted: {len(analysis_df)}")
     except Exception as e:
         logger.error(f"Failed to create DataFrame or export to Excel: {e}")